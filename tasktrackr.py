@@ -7,28 +7,130 @@ from colorama import init, Fore, Style
 import threading
 import sys
 import signal
+import uuid
+import heapq
+import itertools
+import queue
+import selectors
 
-# Initialize colorama
-init()
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class _NoColor:
+    def __getattr__(self, name):
+        return ""
+
+# Initialize colorama on a terminal; when output is piped, skip its stdout
+# wrapper and emit no color codes at all
+if sys.stdout.isatty():
+    init()
+else:
+    Fore = Style = _NoColor()
+
+_VALID_PRIORITIES = frozenset({"low", "medium", "high"})
+
+_PRIORITY_COLOR = {
+    "low": Fore.BLUE,
+    "medium": Fore.YELLOW,
+    "high": Fore.RED
+}
+_STATUS_DONE = f"{Fore.GREEN}✓{Style.RESET_ALL}"
+_STATUS_TODO = f"{Fore.RED}✗{Style.RESET_ALL}"
+
+def _dumps(obj, pretty=False):
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(obj, indent=2 if pretty else None, ensure_ascii=False).encode('utf-8')
+
+def _loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _parse_dt(value):
+    # fromisoformat is much faster than strptime, but it also accepts bare dates
+    # and UTC offsets; only trust it for the documented "YYYY-MM-DD HH:MM" shape
+    if (len(value) == 16 and value[4] == value[7] == "-" and value[10] == " " and
+            value[13] == ":"):
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            pass
+        else:
+            if parsed.tzinfo is None:
+                return parsed
+    return datetime.strptime(value, "%Y-%m-%d %H:%M")
 
 class Task:
+    __slots__ = (
+        "id", "title", "description", "_due_date", "priority", "reminder",
+        "_reminder_time", "completed", "created_at",
+        "_cached_dict", "_due_str", "_reminder_str", "_reminder_ts"
+    )
+
     def __init__(self, title, description="", due_date=None, priority="medium", reminder=False, reminder_time=None):
         if not title or not title.strip():
             raise ValueError("Task title cannot be empty")
         
         self.title = title.strip()
         self.description = description.strip()
-        self.due_date = due_date
+        self._due_date = due_date
+        self._due_str = None
         self.priority = priority.lower() if priority else "medium"
-        if self.priority not in ["low", "medium", "high"]:
+        if self.priority not in _VALID_PRIORITIES:
             self.priority = "medium"
         self.reminder = bool(reminder)
-        self.reminder_time = reminder_time
+        self._reminder_time = reminder_time
+        self._reminder_str = None
+        # Unix timestamp used by the reminder heap; float compares are cheaper than datetime
+        self._reminder_ts = reminder_time.timestamp() if reminder_time else None
         self.completed = False
         self.created_at = datetime.now()
+        self.id = uuid.uuid4().hex
+        self._cached_dict = None
+
+    @property
+    def due_date(self):
+        return self._due_date
+
+    @due_date.setter
+    def due_date(self, value):
+        self._due_date = value
+        self._due_str = None
+        self._cached_dict = None
+
+    @property
+    def reminder_time(self):
+        return self._reminder_time
+
+    @reminder_time.setter
+    def reminder_time(self, value):
+        self._reminder_time = value
+        self._reminder_str = None
+        self._reminder_ts = value.timestamp() if value else None
+        self._cached_dict = None
+
+    @property
+    def due_str(self):
+        if self._due_str is None and self.due_date:
+            self._due_str = self.due_date.strftime('%Y-%m-%d %H:%M')
+        return self._due_str
+
+    @property
+    def reminder_str(self):
+        if self._reminder_str is None and self.reminder_time:
+            self._reminder_str = self.reminder_time.strftime('%Y-%m-%d %H:%M')
+        return self._reminder_str
 
     def to_dict(self):
-        return {
+        # Cached until due_date/reminder_time are reassigned or a caller that changes
+        # another field clears _cached_dict (see TaskManager.toggle_task_completion)
+        if self._cached_dict is not None:
+            return self._cached_dict
+        self._cached_dict = {
+            "id": self.id,
             "title": self.title,
             "description": self.description,
             "due_date": self.due_date.isoformat() if self.due_date else None,
@@ -38,83 +140,212 @@ class Task:
             "completed": self.completed,
             "created_at": self.created_at.isoformat()
         }
+        return self._cached_dict
 
     @classmethod
     def from_dict(cls, data):
+        # Build the task directly instead of going through __init__, but apply the
+        # same normalization since imported files may not have been written by us
         try:
-            task = cls(
-                title=data["title"],
-                description=data.get("description", ""),
-                priority=data.get("priority", "medium"),
-                reminder=data.get("reminder", False)
-            )
-            if data.get("due_date"):
-                task.due_date = datetime.fromisoformat(data["due_date"])
-            if data.get("reminder_time"):
-                task.reminder_time = datetime.fromisoformat(data["reminder_time"])
-            task.completed = data.get("completed", False)
+            get = data.get
+            title = data["title"].strip()
+            if not title:
+                raise ValueError("Task title cannot be empty")
+            task = cls.__new__(cls)
+            task.id = get("id") or uuid.uuid4().hex
+            task.title = title
+            task.description = (get("description") or "").strip()
+            priority = (get("priority") or "medium").lower()
+            task.priority = priority if priority in _VALID_PRIORITIES else "medium"
+            task.reminder = bool(get("reminder", False))
+            due_date = get("due_date")
+            task._due_date = datetime.fromisoformat(due_date) if due_date else None
+            task._due_str = None
+            reminder_time = get("reminder_time")
+            if reminder_time:
+                reminder_time = datetime.fromisoformat(reminder_time)
+                task._reminder_time = reminder_time
+                task._reminder_ts = reminder_time.timestamp()
+            else:
+                task._reminder_time = task._reminder_ts = None
+            task._reminder_str = None
+            task.completed = bool(get("completed", False))
             task.created_at = datetime.fromisoformat(data["created_at"])
+            task._cached_dict = None
             return task
-        except (KeyError, ValueError) as e:
+        except (KeyError, ValueError, TypeError, AttributeError) as e:
             print(f"{Fore.RED}Error loading task: {e}{Style.RESET_ALL}")
             return None
 
 class TaskManager:
     def __init__(self):
-        self.tasks = []
+        self.tasks = {}
         self.data_file = "tasks.json"
+        self.journal_file = "tasks.log"
+        self._journal = None
+        self._journal_len = 0
         self.load_tasks()
         self._running = True
+        self._wake = threading.Event()
+        # Reminder messages are queued for the main thread so they never interleave with prompts
+        self.notifications = queue.Queue()
+        self._reminder_lock = threading.Lock()
+        self._reminder_seq = itertools.count()
+        # task id -> the one heap entry allowed to fire for that task
+        self._live_reminders = {
+            task.id: (task._reminder_ts, next(self._reminder_seq), task)
+            for task in self.tasks.values() if self._has_pending_reminder(task)
+        }
+        self._reminder_heap = list(self._live_reminders.values())
+        heapq.heapify(self._reminder_heap)
 
     def load_tasks(self):
-        if os.path.exists(self.data_file):
-            try:
-                with open(self.data_file, "r", encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.tasks = []
-                    for task_data in data:
-                        task = Task.from_dict(task_data)
-                        if task:
-                            self.tasks.append(task)
-            except json.JSONDecodeError:
-                print(f"{Fore.RED}Error: Invalid JSON in tasks file. Creating new file.{Style.RESET_ALL}")
+        try:
+            with open(self.data_file, "rb") as f:
+                data = _loads(f.read())
+                self.tasks = {}
+                missing_ids = False
+                for task_data in data:
+                    task = Task.from_dict(task_data)
+                    if task:
+                        self.tasks[task.id] = task
+                        missing_ids = missing_ids or not task_data.get("id")
+            # Tasks saved before ids existed just got fresh ones; persist them now
+            # so journal entries written this session refer to ids that survive a restart
+            if missing_ids:
                 self.save_tasks()
-            except Exception as e:
-                print(f"{Fore.RED}Error loading tasks: {e}{Style.RESET_ALL}")
-                self.tasks = []
+        except FileNotFoundError:
+            pass
+        except json.JSONDecodeError:
+            print(f"{Fore.RED}Error: Invalid JSON in tasks file. Creating new file.{Style.RESET_ALL}")
+            self.save_tasks()
+        except Exception as e:
+            print(f"{Fore.RED}Error loading tasks: {e}{Style.RESET_ALL}")
+            self.tasks = {}
+        damaged = self._replay_journal()
+        try:
+            self._journal = open(self.journal_file, "ab", buffering=0)
+        except Exception as e:
+            print(f"{Fore.RED}Error opening journal: {e}{Style.RESET_ALL}")
+        # Fold the journal into a fresh snapshot before appending, otherwise the
+        # next entry would be glued onto a torn line and lost on the next start
+        if damaged:
+            self.save_tasks()
 
-    def save_tasks(self):
+    def _replay_journal(self):
+        # Mutations since the last snapshot live in the journal, one JSON object per line.
+        # Returns True if any line had to be skipped.
         try:
-            with open(self.data_file, "w", encoding='utf-8') as f:
-                json.dump([task.to_dict() for task in self.tasks], f, indent=2, ensure_ascii=False)
+            with open(self.journal_file, "rb") as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            print(f"{Fore.RED}Error reading journal: {e}{Style.RESET_ALL}")
+            return False
+        damaged = False
+        for line in lines:
+            try:
+                self._apply(_loads(line))
+                self._journal_len += 1
+            except (ValueError, KeyError, TypeError):
+                # A torn final line from an interrupted session, or an entry
+                # that no longer applies to the snapshot or isn't an entry at all
+                damaged = True
+        return damaged
+
+    def _apply(self, entry):
+        op = entry["op"]
+        if op == "add":
+            task = Task.from_dict(entry["task"])
+            if task:
+                self.tasks[task.id] = task
+        elif op == "remove":
+            del self.tasks[entry["id"]]
+        elif op == "toggle":
+            task = self.tasks[entry["id"]]
+            task.completed = entry["completed"]
+            task._cached_dict = None
+
+    def _record(self, entry):
+        # Called before self.tasks is changed, so a failed write leaves memory and disk in step
+        if self._journal is not None:
+            self._journal.write(_dumps(entry) + b"\n")
+            self._journal_len += 1
+
+    def _compact_if_needed(self):
+        # Compact once replaying the journal would cost more than the snapshot
+        if self._journal is None or self._journal_len > 2 * len(self.tasks):
+            self.save_tasks()
+
+    def save_tasks(self, sync=False):
+        # Write a temporary file and swap it in so a crash never leaves a half-written snapshot
+        tmp_file = self.data_file + ".tmp"
+        try:
+            with open(tmp_file, "wb") as f:
+                f.write(_dumps([task.to_dict() for task in self.tasks.values()], pretty=True))
+                if sync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_file, self.data_file)
+            if self._journal is not None:
+                self._journal.truncate(0)
+            self._journal_len = 0
         except Exception as e:
             print(f"{Fore.RED}Error saving tasks: {e}{Style.RESET_ALL}")
 
     def add_task(self, task):
         try:
-            self.tasks.append(task)
-            self.save_tasks()
+            self._record({"op": "add", "task": task.to_dict()})
+            self.tasks[task.id] = task
+            self._compact_if_needed()
+            self._schedule_reminder(task)
             return True
         except Exception as e:
             print(f"{Fore.RED}Error adding task: {e}{Style.RESET_ALL}")
             return False
 
-    def remove_task(self, index):
+    def add_tasks(self, tasks):
+        # Bulk imports write one snapshot instead of one journal entry per task.
+        # Tasks whose id is already present are skipped, so importing the same
+        # export twice doesn't overwrite or duplicate anything.
         try:
-            if 0 <= index < len(self.tasks):
-                del self.tasks[index]
+            added = []
+            for task in tasks:
+                if task.id not in self.tasks:
+                    self.tasks[task.id] = task
+                    added.append(task)
+            if added:
                 self.save_tasks()
+            for task in added:
+                self._schedule_reminder(task)
+            return len(added)
+        except Exception as e:
+            print(f"{Fore.RED}Error adding tasks: {e}{Style.RESET_ALL}")
+            return 0
+
+    def remove_task(self, task_id):
+        try:
+            if task_id in self.tasks:
+                self._record({"op": "remove", "id": task_id})
+                del self.tasks[task_id]
+                self._compact_if_needed()
                 return True
             return False
         except Exception as e:
             print(f"{Fore.RED}Error removing task: {e}{Style.RESET_ALL}")
             return False
 
-    def toggle_task_completion(self, index):
+    def toggle_task_completion(self, task_id):
         try:
-            if 0 <= index < len(self.tasks):
-                self.tasks[index].completed = not self.tasks[index].completed
-                self.save_tasks()
+            task = self.tasks.get(task_id)
+            if task is not None:
+                completed = not task.completed
+                self._record({"op": "toggle", "id": task_id, "completed": completed})
+                task.completed = completed
+                task._cached_dict = None
+                self._compact_if_needed()
+                self._schedule_reminder(task)
                 return True
             return False
         except Exception as e:
@@ -124,33 +355,130 @@ class TaskManager:
     def get_tasks(self, show_completed=True):
         try:
             if show_completed:
-                return self.tasks
-            return [task for task in self.tasks if not task.completed]
+                return list(self.tasks.values())
+            return [task for task in self.tasks.values() if not task.completed]
         except Exception as e:
             print(f"{Fore.RED}Error getting tasks: {e}{Style.RESET_ALL}")
             return []
 
+    @staticmethod
+    def _has_pending_reminder(task):
+        return bool(task.reminder and task.reminder_time and not task.completed)
+
+    def _schedule_reminder(self, task):
+        if not self._has_pending_reminder(task):
+            return
+        with self._reminder_lock:
+            live = self._live_reminders.get(task.id)
+            if live is not None and live[2] is task and live[0] == task._reminder_ts:
+                return
+            entry = (task._reminder_ts, next(self._reminder_seq), task)
+            self._live_reminders[task.id] = entry
+            heapq.heappush(self._reminder_heap, entry)
+        self._wake.set()
+
     def check_reminders(self):
+        """Show every reminder that has come due and return the number of
+        seconds until the next one, or None once the manager is stopped."""
         if not self._running:
-            return
-            
+            return None
+
         try:
-            now = datetime.now()
-            for task in self.tasks:
-                if (task.reminder and task.reminder_time and 
-                    not task.completed and 
-                    task.reminder_time <= now):
-                    print(f"\n{Fore.YELLOW}REMINDER: {task.title}{Style.RESET_ALL}")
-                    print(f"Description: {task.description}")
-                    if task.due_date:
-                        print(f"Due Date: {task.due_date.strftime('%Y-%m-%d %H:%M')}")
-                    print(f"Priority: {task.priority}\n")
+            now = time.time()
+            due = []
+            with self._reminder_lock:
+                while self._reminder_heap and self._reminder_heap[0][0] <= now:
+                    entry = heapq.heappop(self._reminder_heap)
+                    reminder_ts, _, task = entry
+                    # Entries replaced by a later schedule are dead; skip them, and
+                    # skip tasks that were deleted, completed or rescheduled
+                    if self._live_reminders.get(task.id) is not entry:
+                        continue
+                    del self._live_reminders[task.id]
+                    if (self.tasks.get(task.id) is task and self._has_pending_reminder(task) and
+                            task._reminder_ts == reminder_ts):
+                        due.append(task)
+                if self._reminder_heap:
+                    delay = self._reminder_heap[0][0] - now
+                else:
+                    delay = 3600
+            for task in due:
+                lines = [
+                    f"\n{Fore.YELLOW}REMINDER: {task.title}{Style.RESET_ALL}",
+                    f"Description: {task.description}"
+                ]
+                if task.due_date:
+                    lines.append(f"Due Date: {task.due_str}")
+                lines.append(f"Priority: {task.priority}\n")
+                self.notifications.put("\n".join(lines))
+            return delay
         except Exception as e:
-            print(f"{Fore.RED}Error checking reminders: {e}{Style.RESET_ALL}")
+            self.notifications.put(f"{Fore.RED}Error checking reminders: {e}{Style.RESET_ALL}")
+            return 60
+
+    def run_reminder_checker(self):
+        # Sleep until the next reminder is due; add/toggle/stop wake us early
+        while self._running:
+            delay = self.check_reminders()
+            if delay is None:
+                break
+            self._wake.wait(delay)
+            self._wake.clear()
 
     def stop(self):
         self._running = False
-        self.save_tasks()
+        self._wake.set()
+        self.save_tasks(sync=True)
+        if self._journal is not None:
+            try:
+                os.fsync(self._journal.fileno())
+                self._journal.close()
+            except Exception as e:
+                print(f"{Fore.RED}Error closing journal: {e}{Style.RESET_ALL}")
+            self._journal = None
+
+_stdin_selector = None
+
+def make_stdin_selector():
+    # select() only works on console handles outside Windows, and only an
+    # interactive terminal hands readline() exactly one line per read
+    if sys.platform == "win32" or not sys.stdin.isatty():
+        return None
+    try:
+        selector = selectors.DefaultSelector()
+        selector.register(sys.stdin, selectors.EVENT_READ)
+        return selector
+    except (OSError, ValueError):
+        return None
+
+def show_notifications():
+    shown = False
+    if 'task_manager' in globals():
+        while True:
+            try:
+                message = task_manager.notifications.get_nowait()
+            except queue.Empty:
+                break
+            print(message)
+            shown = True
+    return shown
+
+def read_input(prompt=""):
+    """Like input(), but prints queued reminders while waiting for the user."""
+    show_notifications()
+    if _stdin_selector is None:
+        return input(prompt)
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    while True:
+        if _stdin_selector.select(timeout=0.5):
+            line = sys.stdin.readline()
+            if not line:
+                raise EOFError
+            return line.rstrip("\n")
+        if show_notifications():
+            sys.stdout.write(prompt)
+            sys.stdout.flush()
 
 def print_menu():
     print(f"\n{Fore.CYAN}=== TaskTrackr ==={Style.RESET_ALL}")
@@ -158,25 +486,26 @@ def print_menu():
     print("2. View Tasks")
     print("3. Mark Task as Complete/Incomplete")
     print("4. Delete Task")
-    print("5. Exit")
+    print("5. Import from JSON")
+    print("6. Exit")
     print(f"{Fore.CYAN}=================={Style.RESET_ALL}")
 
 def get_task_input():
     while True:
-        title = input("Enter task title: ").strip()
+        title = read_input("Enter task title: ").strip()
         if title:
             break
         print(f"{Fore.RED}Title cannot be empty. Please try again.{Style.RESET_ALL}")
 
-    description = input("Enter task description (optional): ").strip()
+    description = read_input("Enter task description (optional): ").strip()
     
     due_date = None
     while True:
-        due_date_str = input("Enter due date (YYYY-MM-DD HH:MM) or press Enter to skip: ").strip()
+        due_date_str = read_input("Enter due date (YYYY-MM-DD HH:MM) or press Enter to skip: ").strip()
         if not due_date_str:
             break
         try:
-            due_date = datetime.strptime(due_date_str, "%Y-%m-%d %H:%M")
+            due_date = _parse_dt(due_date_str)
             if due_date < datetime.now():
                 print(f"{Fore.YELLOW}Warning: Due date is in the past.{Style.RESET_ALL}")
             break
@@ -184,19 +513,19 @@ def get_task_input():
             print(f"{Fore.RED}Invalid date format. Please use YYYY-MM-DD HH:MM{Style.RESET_ALL}")
 
     while True:
-        priority = input("Enter priority (low/medium/high) [default: medium]: ").lower().strip()
-        if not priority or priority in ["low", "medium", "high"]:
+        priority = read_input("Enter priority (low/medium/high) [default: medium]: ").lower().strip()
+        if not priority or priority in _VALID_PRIORITIES:
             priority = priority or "medium"
             break
         print(f"{Fore.RED}Invalid priority. Please choose from: low, medium, high{Style.RESET_ALL}")
 
-    reminder = input("Set reminder? (y/n) [default: n]: ").lower().strip() == "y"
+    reminder = read_input("Set reminder? (y/n) [default: n]: ").lower().strip() == "y"
     reminder_time = None
     if reminder:
         while True:
-            reminder_str = input("Enter reminder time (YYYY-MM-DD HH:MM): ").strip()
+            reminder_str = read_input("Enter reminder time (YYYY-MM-DD HH:MM): ").strip()
             try:
-                reminder_time = datetime.strptime(reminder_str, "%Y-%m-%d %H:%M")
+                reminder_time = _parse_dt(reminder_str)
                 if reminder_time < datetime.now():
                     print(f"{Fore.YELLOW}Warning: Reminder time is in the past.{Style.RESET_ALL}")
                 if due_date and reminder_time > due_date:
@@ -214,7 +543,7 @@ def handle_exit(signum, frame):
     sys.exit(0)
 
 def main():
-    global task_manager
+    global task_manager, _stdin_selector
     
     # Set up signal handlers for graceful shutdown
     signal.signal(signal.SIGINT, handle_exit)
@@ -222,18 +551,14 @@ def main():
     
     task_manager = TaskManager()
     
-    def run_reminder_checker():
-        while task_manager._running:
-            task_manager.check_reminders()
-            time.sleep(60)  # Check every minute
-
-    reminder_thread = threading.Thread(target=run_reminder_checker, daemon=True)
+    reminder_thread = threading.Thread(target=task_manager.run_reminder_checker, daemon=True)
     reminder_thread.start()
+    _stdin_selector = make_stdin_selector()
 
     while True:
         try:
             print_menu()
-            choice = input("Enter your choice (1-5): ").strip()
+            choice = read_input("Enter your choice (1-6): ").strip()
 
             if choice == "1":
                 try:
@@ -248,23 +573,21 @@ def main():
                 if not tasks:
                     print("No tasks found.")
                 else:
-                    print(f"\n{Fore.CYAN}Your Tasks:{Style.RESET_ALL}")
+                    # Build the whole listing first and write it in one go
+                    out = [f"\n{Fore.CYAN}Your Tasks:{Style.RESET_ALL}"]
                     for i, task in enumerate(tasks):
-                        status = f"{Fore.GREEN}✓{Style.RESET_ALL}" if task.completed else f"{Fore.RED}✗{Style.RESET_ALL}"
-                        priority_color = {
-                            "low": Fore.BLUE,
-                            "medium": Fore.YELLOW,
-                            "high": Fore.RED
-                        }.get(task.priority, Fore.WHITE)
+                        status = _STATUS_DONE if task.completed else _STATUS_TODO
+                        priority_color = _PRIORITY_COLOR.get(task.priority, Fore.WHITE)
                         
-                        print(f"\n{status} {i+1}. {task.title}")
+                        out.append(f"\n{status} {i+1}. {task.title}")
                         if task.description:
-                            print(f"   Description: {task.description}")
+                            out.append(f"   Description: {task.description}")
                         if task.due_date:
-                            print(f"   Due: {task.due_date.strftime('%Y-%m-%d %H:%M')}")
-                        print(f"   Priority: {priority_color}{task.priority}{Style.RESET_ALL}")
+                            out.append(f"   Due: {task.due_str}")
+                        out.append(f"   Priority: {priority_color}{task.priority}{Style.RESET_ALL}")
                         if task.reminder and task.reminder_time:
-                            print(f"   Reminder: {task.reminder_time.strftime('%Y-%m-%d %H:%M')}")
+                            out.append(f"   Reminder: {task.reminder_str}")
+                    print("\n".join(out))
 
             elif choice == "3":
                 tasks = task_manager.get_tasks()
@@ -272,8 +595,8 @@ def main():
                     print("No tasks to update.")
                 else:
                     try:
-                        index = int(input("Enter task number to toggle completion: ")) - 1
-                        if task_manager.toggle_task_completion(index):
+                        index = int(read_input("Enter task number to toggle completion: ")) - 1
+                        if 0 <= index < len(tasks) and task_manager.toggle_task_completion(tasks[index].id):
                             print(f"{Fore.GREEN}Task status updated!{Style.RESET_ALL}")
                         else:
                             print(f"{Fore.RED}Invalid task number.{Style.RESET_ALL}")
@@ -286,8 +609,8 @@ def main():
                     print("No tasks to delete.")
                 else:
                     try:
-                        index = int(input("Enter task number to delete: ")) - 1
-                        if task_manager.remove_task(index):
+                        index = int(read_input("Enter task number to delete: ")) - 1
+                        if 0 <= index < len(tasks) and task_manager.remove_task(tasks[index].id):
                             print(f"{Fore.GREEN}Task deleted successfully!{Style.RESET_ALL}")
                         else:
                             print(f"{Fore.RED}Invalid task number.{Style.RESET_ALL}")
@@ -295,6 +618,21 @@ def main():
                         print(f"{Fore.RED}Please enter a valid number.{Style.RESET_ALL}")
 
             elif choice == "5":
+                path = read_input("Enter path to JSON file: ").strip()
+                try:
+                    with open(path, "rb") as f:
+                        data = _loads(f.read())
+                    if not isinstance(data, list):
+                        raise ValueError("file must contain a JSON list of tasks")
+                    tasks = [task for task in map(Task.from_dict, data) if task]
+                    count = task_manager.add_tasks(tasks)
+                    print(f"{Fore.GREEN}Imported {count} task(s).{Style.RESET_ALL}")
+                    if count < len(tasks):
+                        print(f"{Fore.YELLOW}Skipped {len(tasks) - count} task(s) already in your list.{Style.RESET_ALL}")
+                except (OSError, ValueError) as e:
+                    print(f"{Fore.RED}Error importing tasks: {e}{Style.RESET_ALL}")
+
+            elif choice == "6":
                 print(f"{Fore.YELLOW}Goodbye!{Style.RESET_ALL}")
                 task_manager.stop()
                 break